@@ -2,29 +2,28 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import base64
-import plotly.express as px
+import pyarrow as pa
+import pyarrow.compute as pc
+import plotly.graph_objects as go
+from plotly.colors import qualitative
 
-# Function to set background image using HTML and CSS
-def set_background(image_path):
+# Function to build the background CSS, cached so the image is read and encoded once per process
+@st.cache_data(show_spinner=False)
+def background_css(image_path):
     """
-        Sets a custom background image for the Streamlit application.
+        Builds the inline CSS that sets an image as the app background.
 
-        This function applies a specified image as the background for a Streamlit app
-        using inline CSS. The image is converted to a base64-encoded string to embed
-        it directly into the CSS.
+        The image is converted to a base64-encoded string to embed it directly into the CSS.
 
         Args:
             image_path (str): The file path of the image to be used as the background.
 
         Returns:
-            None: This function modifies the Streamlit app's layout directly by injecting
-                HTML and CSS. No return value.
+            str: A `<style>` block setting the image as the `.stApp` background.
     """
     with open(image_path, "rb") as image_file:
-        image_data = image_file.read()
-        base64_image = base64.b64encode(image_data).decode()
-    st.markdown(
-        f"""
+        base64_image = base64.b64encode(image_file.read()).decode()
+    return f"""
         <style>
         .stApp {{
             background-image: url("data:image/webp;base64,{base64_image}");
@@ -33,11 +32,173 @@ def set_background(image_path):
             background-attachment: fixed;
         }}
         </style>
-        """,
-        unsafe_allow_html=True
-    )
+        """
 
-def eda(df, c1, c2):
+# Function to set background image using HTML and CSS
+def set_background(image_path):
+    """
+        Sets a custom background image for the Streamlit application.
+
+        This function applies a specified image as the background for a Streamlit app
+        using the cached inline CSS from `background_css`.
+
+        Args:
+            image_path (str): The file path of the image to be used as the background.
+
+        Returns:
+            None: This function modifies the Streamlit app's layout directly by injecting
+                HTML and CSS. No return value.
+    """
+    st.markdown(background_css(image_path), unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def load_desc():
+    """
+        Loads the data description table shown on the IDA page.
+
+        Returns:
+            pd.DataFrame: The contents of `data/data_description.csv`.
+    """
+    return pd.read_csv('data/data_description.csv')
+
+@st.cache_data(show_spinner=False)
+def load_year(year: int) -> pd.DataFrame:
+    """
+        Loads and prepares the employment data for a single year.
+
+        The result is cached per `year`, so widget interactions that keep the year
+        unchanged reuse the prepared DataFrame instead of re-reading the file.
+
+        Args:
+            year (int): The year to load from the `data/ces_all.parquet` dataset.
+
+        Returns:
+            pd.DataFrame: Mean employment per county and industry, with categorical `County`
+                and `Industry` columns and an Arrow-backed `Current Employment` column.
+    """
+    # Imported here as neither pandas nor streamlit loads it, so only the EDA page pays for it
+    import pyarrow.dataset as ds
+
+    # Drop columns containing 'Total' or 'Other' (case-insensitive match) while reading
+    is_total_or_other = pc.match_substring_regex(ds.field('Industry Title').cast(pa.string()),
+                                                 r'\b(?:Total|Other)\b', ignore_case=True)
+    # Read only the requested year, pruning the other partitions of the dataset
+    table = ds.dataset('data/ces_all.parquet', partitioning='hive').to_table(
+        filter=(ds.field('year') == year) & ~is_total_or_other,
+        columns=['Area Name', 'Industry Title', 'Current Employment'])
+    # Keep the dictionary-encoded string columns as categoricals so grouping works on integer codes
+    df= table.to_pandas(types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t))
+    # Average employment per (county, industry) pair by counting on a combined integer key
+    # built from the category codes, which is much faster than a pandas groupby
+    areas = df['Area Name'].cat.categories
+    industries = df['Industry Title'].cat.categories
+    key = df['Area Name'].cat.codes.to_numpy(np.int64) * len(industries) + df['Industry Title'].cat.codes.to_numpy(np.int64)
+    sums = np.bincount(key, weights=df['Current Employment'].to_numpy(np.float64))
+    counts = np.bincount(key)
+    k = np.flatnonzero(counts)
+    return pd.DataFrame({
+        'County': pd.Categorical.from_codes(k // len(industries), categories=areas),
+        'Industry': pd.Categorical.from_codes(k % len(industries), categories=industries),
+        # Arrow-backed, so st.dataframe can hand the buffers to the browser without conversion
+        'Current Employment': pd.array(np.round(sums[k] / counts[k]), dtype=pd.ArrowDtype(pa.float64())),
+    })
+
+@st.cache_resource(show_spinner=False)
+def eda_prep(year, c1):
+    """
+        Precomputes the aggregations shown on the EDA page.
+
+        The result is cached per `(year, c1)` as a shared resource, so changing the selected
+        `c1` entity only needs a dictionary lookup instead of filtering and sorting the data
+        again, without copying the cached frames on every rerun. Callers must treat the
+        returned objects as read-only.
+
+        Args:
+            year (int): The year of the employment data to analyze.
+            c1 (str): The primary column name for grouping data (e.g., "County").
+
+        Returns:
+            tuple: A tuple containing:
+                - grouped_df (pd.DataFrame): Total employment per `c1`, sorted in descending order.
+                - top_10_c1 (pd.DataFrame): The top 10 rows of `grouped_df`.
+                - per_c1 (dict): Maps each `c1` value to a `(top_7, others, others_sum)` tuple holding
+                  its top 7 `c2` rows, the remaining rows and their total employment.
+    """
+    df = load_year(year)
+    c1_totals = df.groupby(c1, as_index=False, observed=True, sort=False)['Current Employment'].sum()
+    grouped_df= c1_totals.sort_values('Current Employment', ascending=False)
+    top_10_c1 = grouped_df.iloc[:10]
+
+    # Reuse the totals from the groupby above, so "Others" is just total minus top 7
+    totals = dict(zip(c1_totals[c1], c1_totals['Current Employment']))
+    # Keep the dropdown in the order of the loaded frame, not in group or employment order
+    groups = dict(iter(df.groupby(c1, observed=True, sort=False)))
+    per_c1 = {}
+    for selected_c1 in df[c1].unique():
+        c1_data = groups[selected_c1]
+        top_7 = c1_data.nlargest(7, 'Current Employment')
+        # Only the rows outside the top 7 need sorting for their table
+        others = c1_data.drop(top_7.index).sort_values(by='Current Employment', ascending=False)
+        others_sum = totals[selected_c1] - top_7['Current Employment'].sum()
+        per_c1[selected_c1] = (top_7, others, others_sum)
+    return grouped_df, top_10_c1, per_c1
+
+@st.cache_resource(show_spinner=False)
+def make_bar_fig(year, c1, _top_10_c1):
+    """
+        Builds the bar chart of the top 10 `c1` entities by employment.
+
+        The figure is cached per `(year, c1)`, so reruns with unchanged inputs reuse it.
+        The data argument is excluded from the cache key, as it is determined by those inputs.
+
+        Args:
+            year (int): The year of the employment data to analyze.
+            c1 (str): The primary column name for grouping data (e.g., "County").
+            _top_10_c1 (pd.DataFrame): The top 10 `c1` entities by employment.
+
+        Returns:
+            plotly.graph_objects.Figure: The bar chart figure.
+    """
+    # Create interactive bar plot using Plotly graph objects, skipping the px DataFrame copy
+    fig = go.Figure(go.Bar(x=_top_10_c1[c1], y=_top_10_c1['Current Employment'],
+                           marker=dict(color=_top_10_c1['Current Employment'], colorscale='Viridis',
+                                       colorbar=dict(title='Employment'))))
+    fig.update_layout(title=f"Top 10 {c1} by Employment", xaxis_title=c1, yaxis_title='Employment')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def make_pie_fig(year, c1, c2, selected_c1, _top_7, _others, _others_sum):
+    """
+        Builds the pie chart of the `c2` distribution within the selected `c1` entity.
+
+        The figure is cached per `(year, c1, c2, selected_c1)`, so reruns with unchanged
+        inputs reuse it. The data arguments are excluded from the cache key, as they are
+        determined by those inputs.
+
+        Args:
+            year (int): The year of the employment data to analyze.
+            c1 (str): The primary column name for grouping data (e.g., "County").
+            c2 (str): The secondary column name for analyzing distributions (e.g., "Industry").
+            selected_c1 (str): The `c1` entity whose distribution is shown.
+            _top_7 (pd.DataFrame): The top 7 `c2` rows of the selected `c1` entity.
+            _others (pd.DataFrame): The remaining rows of the selected `c1` entity.
+            _others_sum (float): The total employment of the remaining rows.
+
+        Returns:
+            plotly.graph_objects.Figure: The pie chart figure.
+    """
+    names = _top_7[c2].tolist()
+    values = _top_7['Current Employment'].tolist()
+    # If there are more than 7 rows, group the remaining ones as "Others"
+    if len(_others) > 0:
+        names.append('Others')
+        values.append(_others_sum)
+    # Create a Pie chart (Circular Chart) to display the distribution
+    fig = go.Figure(go.Pie(labels=names, values=values, marker=dict(colors=qualitative.Set2)))
+    fig.update_layout(title=f"{c2} Distribution in {selected_c1}")
+    return fig
+
+def eda(year, c1, c2):
     """
         Displays the Exploratory Data Analysis (EDA) page for employment data.
 
@@ -46,9 +207,9 @@ def eda(df, c1, c2):
         in a pie chart, and detailed data tables.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing employment data.
-            c1 (str): The primary column name for grouping data (e.g., "Area Name").
-            c2 (str): The secondary column name for analyzing distributions (e.g., "Industry Title").
+            year (int): The year of the employment data to analyze.
+            c1 (str): The primary column name for grouping data (e.g., "County").
+            c2 (str): The secondary column name for analyzing distributions (e.g., "Industry").
 
         Returns:
             None: The function directly renders interactive visualizations and tables using Streamlit.
@@ -59,49 +220,23 @@ def eda(df, c1, c2):
             - Pie chart for `c2` distribution within the selected `c1`.
             - Scrollable data tables for detailed analysis.
     """
-    grouped_df= df.groupby(c1)['Current Employment'].sum().reset_index().sort_values('Current Employment', ascending=False)
+    grouped_df, top_10_c1, per_c1 = eda_prep(year, c1)
     # Display rest of the counties with scrolling
     st.subheader(f"{c1} wise employment")
-    # Create interactive bar plot using Plotly
-    top_10_c1 = grouped_df.head(10)
-    fig = px.bar(top_10_c1, x=c1, y='Current Employment', 
-                title=f"Top 10 {c1} by Employment",
-                labels={c1: c1, 'Current Employment': 'Employment'},
-                color='Current Employment', color_continuous_scale='Viridis')
-    
     # Show interactive plot
-    st.plotly_chart(fig)
+    st.plotly_chart(make_bar_fig(year, c1, top_10_c1))
     
-    st.dataframe(grouped_df.tail(len(grouped_df) - 8), use_container_width=True)
+    st.dataframe(grouped_df.iloc[8:], use_container_width=True)
     
     # Streamlit Dropdown for selecting County
-    c1_list = df[c1].unique()
-    selected_c1 = st.selectbox(f"Select {c1}", c1_list)
-    c1_data = df[df[c1] == selected_c1].sort_values(by='Current Employment', ascending=False).reset_index()
-    
-    
-    # If there are more than 7 rows, group the remaining ones as "Others"
-    if len(c1_data) > 7:
-        top_7 = c1_data.head(7)
-        others = c1_data.iloc[7:]
-        others_sum = others['Current Employment'].sum()
-        others_data = pd.DataFrame({c2: ['Others'], 'Current Employment': [others_sum]})
-        c1_data_t7 = pd.concat([top_7, others_data], ignore_index=True)
-    else:
-        c1_data_t7= c1_data.copy()
+    selected_c1 = st.selectbox(f"Select {c1}", list(per_c1))
+    top_7, others, others_sum = per_c1[selected_c1]
     st.subheader(f"{c2} wise breakdown for {selected_c1} {c1} ")
-    # Create a Pie chart (Circular Chart) to display the distribution
-    fig = px.pie(c1_data_t7, names=c2, values='Current Employment', 
-                title=f"{c2} Distribution in {selected_c1}",
-                color=c2, color_discrete_sequence=px.colors.qualitative.Set2)
     # Display the Pie chart
-    st.plotly_chart(fig)
+    st.plotly_chart(make_pie_fig(year, c1, c2, selected_c1, top_7, others, others_sum))
     
     # Display the table with occupation data
-    st.dataframe(c1_data.tail(len(grouped_df) - 8), use_container_width=True)
-
-# Reading DataFrames
-desc = pd.read_csv('data/data_description.csv')
+    st.dataframe(others, use_container_width=True)
 
 # Set Streamlit app config for a wider layout and light theme
 st.set_page_config(layout="wide", page_title="California CES Analysis", initial_sidebar_state="expanded")
@@ -153,7 +288,7 @@ elif options == "IDA":
     #### Tables
     **California CES**: Contains details of employment statistics of California over the years (2014 to 2024) across various industries.
     """)
-    st.table(desc)
+    st.table(load_desc())
     st.markdown("""
     ### Missing Value
     The dataset has no missing or invalid value.
@@ -177,22 +312,12 @@ elif options == "EDA":
         # Dropdown filter for choosing between country-wise occupation or occupation-wise country
         filter_option = st.selectbox("Select Analysis Type", ["County-wise Industry", "Industry-wise County"])
     
-    df= pd.read_csv(f'data/{year}.csv')
-    # Remove leading and trailing spaces in column names
-    df['Industry Title'] = df['Industry Title'].str.strip()
-    # Drop columns containing 'Total' or 'Other' (case-insensitive match)
-    df = df[~df['Industry Title'].str.contains(r'\b(Total|Other)\b', case=False, na=False)]
-    df= df.groupby(['Area Name', 'Industry Title'])['Current Employment'].mean().round().reset_index()
-    
-    df.columns=['County', 'Industry','Current Employment']
-    c1='County'
-    c2='Industry'
     if filter_option == "County-wise Industry":
         st.write(f"Showing data for {year}: {filter_option}")
-        eda(df, 'County', 'Industry')
+        eda(year, 'County', 'Industry')
     else:
         st.write(f"Showing data for {year}: {filter_option}")
-        eda(df, 'Industry', 'County')
+        eda(year, 'Industry', 'County')
 
 
 
@@ -0,0 +1,55 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Columns used by the Streamlit app
+COLUMNS = ['Area Name', 'Industry Title', 'Current Employment']
+YEARS = range(2014, 2025)
+DATASET_PATH = 'data/ces_all.parquet'
+
+def read_year(year):
+    """
+        Reads the columns used by the app from the CSV file of a single year.
+
+        The file is parsed with the multithreaded PyArrow CSV reader into Arrow-backed columns.
+
+        Args:
+            year (int): The year whose `data/{year}.csv` file should be read.
+
+        Returns:
+            pd.DataFrame: The `COLUMNS` of the file, with an added `year` column.
+    """
+    table = pacsv.read_csv(f'data/{year}.csv',
+                           convert_options=pacsv.ConvertOptions(include_columns=COLUMNS))
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    df['year'] = year
+    return df
+
+def build_dataset():
+    """
+        Combines all yearly CSV files into a single Parquet dataset partitioned by year.
+
+        Industry titles are stripped of surrounding whitespace and both string columns are
+        stored as categoricals. Each year is written to its own `year=<year>` directory with
+        zstd compression, so the app can read a single year through partition pruning.
+        Existing partitions are replaced, so the script can be rerun after the CSV files change.
+
+        Returns:
+            None: The result is written to `DATASET_PATH`.
+    """
+    df = pd.concat([read_year(year) for year in YEARS], ignore_index=True)
+    # Clean the strings once here so the app never has to, and store them dictionary-encoded
+    df['Industry Title'] = df['Industry Title'].str.strip()
+    df['Area Name'] = df['Area Name'].astype('category')
+    df['Industry Title'] = df['Industry Title'].astype('category')
+    # Sort by industry so repeated values sit together and the files compress better
+    df = df.sort_values(['year', 'Industry Title'], ignore_index=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(table, DATASET_PATH, partition_cols=['year'], compression='zstd',
+                        basename_template='part-{i}.parquet',
+                        existing_data_behavior='delete_matching')
+
+if __name__ == "__main__":
+    build_dataset()
+    print(f"Wrote {DATASET_PATH}")